@@ -132,6 +132,23 @@ class ProgressMonitor:
                 except Exception as e:
                     self._add_alert('callback_error', f"Progress callback failed: {str(e)}")
     
+    def increment_progress(self,
+                          operation_id: str,
+                          processed_delta: int = 1,
+                          failed_delta: int = 0) -> None:
+        """Atomically add to an operation's counters (safe to call from worker threads)"""
+        
+        with self._lock:
+            if operation_id not in self._monitored_operations:
+                return
+            
+            operation = self._monitored_operations[operation_id]
+            self.update_progress(
+                operation_id,
+                operation['processed_items'] + processed_delta,
+                operation['failed_items'] + failed_delta
+            )
+    
     def complete_operation(self, 
                           operation_id: str,
                           status: str = 'completed') -> None:
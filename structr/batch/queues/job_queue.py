@@ -131,6 +131,7 @@ class JobQueue:
         self._pending_queue = queue.PriorityQueue()
         self._running_jobs: Dict[str, Job] = {}
         self._completed_jobs: Dict[str, Job] = {}
+        self._transient_jobs: set = set()  # In-process jobs never written to disk
         
         self._lock = threading.RLock()
         self._workers: List[threading.Thread] = []
@@ -147,8 +148,13 @@ class JobQueue:
         """Register a processor function for a job type"""
         self._job_processors[job_type] = processor
     
-    def submit_job(self, job_type: JobType, input_data: Any, **kwargs) -> str:
-        """Submit a new job to the queue"""
+    def submit_job(self, job_type: JobType, input_data: Any, serialize: bool = True, **kwargs) -> str:
+        """
+        Submit a new job to the queue.
+        
+        With serialize=False the job is kept in memory only: input_data is
+        stored by reference and the job is never JSON-encoded to disk.
+        """
         job = Job(
             id=str(uuid.uuid4()),
             job_type=job_type,
@@ -158,6 +164,8 @@ class JobQueue:
         
         with self._lock:
             self._jobs[job.id] = job
+            if not serialize:
+                self._transient_jobs.add(job.id)
             
             # Check dependencies
             if self._check_dependencies(job):
@@ -232,6 +240,7 @@ class JobQueue:
             
             for job_id in jobs_to_remove:
                 del self._jobs[job_id]
+                self._transient_jobs.discard(job_id)
                 job_file = self.storage_dir / f"{job_id}.json"
                 if job_file.exists():
                     job_file.unlink()
@@ -373,6 +382,9 @@ class JobQueue:
     
     def _save_job(self, job: Job) -> None:
         """Persist job to disk"""
+        if job.id in self._transient_jobs:
+            return
+        
         try:
             job_file = self.storage_dir / f"{job.id}.json"
             with open(job_file, 'w') as f:
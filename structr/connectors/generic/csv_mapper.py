@@ -14,6 +14,16 @@ import re
 import time
 from datetime import datetime
 
+try:
+    from rapidfuzz.distance import Indel
+    _string_ratio = Indel.normalized_similarity
+except ImportError:
+    # rapidfuzz is optional; difflib gives the same ratio in pure Python
+    from difflib import SequenceMatcher
+    
+    def _string_ratio(a: str, b: str) -> float:
+        return SequenceMatcher(None, a, b).ratio()
+
 from ..base import BaseConnector, ConnectorConfig, ImportResult, ExportResult
 from models.pdp import ProductData
 
@@ -42,6 +52,9 @@ class GenericCSVMapper(BaseConnector):
         # Cache for detected mappings
         self._detected_mappings: Dict[str, str] = {}
         self._column_types: Dict[str, str] = {}
+        
+        # Synonym table built once; field-matching helpers consult it per column
+        self._synonyms: Dict[str, str] = self._default_field_mapping()
     
     def _default_field_mapping(self) -> Dict[str, str]:
         """Return flexible field mapping patterns"""
@@ -116,18 +129,7 @@ class GenericCSVMapper(BaseConnector):
                 'delimiter': ',',
                 'has_header': True
             },
-            'columns': {},
-            'row_count': 0,
-            'data_quality': {
-                'overall_score': 0,
-                'completeness': {},
-                'consistency': {},
-                'issues': []
-            },
-            'suggested_mappings': {},
-            'mapping_confidence': {},
-            'sample_data': [],
-            'recommendations': []
+            **self._empty_analysis()
         }
         
         try:
@@ -143,32 +145,70 @@ class GenericCSVMapper(BaseConnector):
                 nrows=sample_size
             )
             
-            analysis['row_count'] = len(df)
-            
-            # Analyze each column
-            for col in df.columns:
-                col_analysis = self._analyze_column(df[col], col)
-                analysis['columns'][col] = col_analysis
-            
-            # Generate field mapping suggestions
-            mapping_results = self._suggest_advanced_mappings(df.columns, df)
-            analysis['suggested_mappings'] = mapping_results['mappings']
-            analysis['mapping_confidence'] = mapping_results['confidence']
-            
-            # Data quality assessment
-            analysis['data_quality'] = self._assess_data_quality(df)
-            
-            # Sample data
-            analysis['sample_data'] = df.head(3).to_dict('records')
-            
-            # Generate recommendations
-            analysis['recommendations'] = self._generate_recommendations(analysis)
+            self._analyze_frame(df, analysis)
             
         except Exception as e:
             analysis['error'] = str(e)
         
         return analysis
     
+    def analyze_dataframe(self, data: Union[pd.DataFrame, Dict[str, List[Any]]]) -> Dict[str, Any]:
+        """
+        Analyze in-memory data (DataFrame or dict of column -> values).
+        
+        Same result as analyze_csv_structure, minus 'file_info', without
+        writing or re-parsing a CSV file.
+        """
+        analysis = self._empty_analysis()
+        
+        try:
+            df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            self._analyze_frame(df, analysis)
+        except Exception as e:
+            analysis['error'] = str(e)
+        
+        return analysis
+    
+    def _empty_analysis(self) -> Dict[str, Any]:
+        """Analysis result skeleton shared by the CSV and in-memory paths"""
+        return {
+            'columns': {},
+            'row_count': 0,
+            'data_quality': {
+                'overall_score': 0,
+                'completeness': {},
+                'consistency': {},
+                'issues': []
+            },
+            'suggested_mappings': {},
+            'mapping_confidence': {},
+            'sample_data': [],
+            'recommendations': []
+        }
+    
+    def _analyze_frame(self, df: pd.DataFrame, analysis: Dict[str, Any]) -> None:
+        """Fill column, mapping, quality and recommendation sections from a DataFrame"""
+        analysis['row_count'] = len(df)
+        
+        # Analyze each column
+        for col in df.columns:
+            col_analysis = self._analyze_column(df[col], col)
+            analysis['columns'][col] = col_analysis
+        
+        # Generate field mapping suggestions
+        mapping_results = self._suggest_advanced_mappings(df.columns, df)
+        analysis['suggested_mappings'] = mapping_results['mappings']
+        analysis['mapping_confidence'] = mapping_results['confidence']
+        
+        # Data quality assessment
+        analysis['data_quality'] = self._assess_data_quality(df)
+        
+        # Sample data
+        analysis['sample_data'] = df.head(3).to_dict('records')
+        
+        # Generate recommendations
+        analysis['recommendations'] = self._generate_recommendations(analysis)
+    
     def _detect_csv_encoding(self, csv_path: Path) -> Dict[str, str]:
         """Detect CSV encoding and delimiter"""
         info = {'encoding': 'utf-8', 'delimiter': ',', 'has_header': True}
@@ -328,8 +368,8 @@ class GenericCSVMapper(BaseConnector):
         col_lower = column_name.lower().replace(' ', '_').replace('-', '_')
         
         # Exact matches get highest score
-        if col_lower in self._default_field_mapping():
-            return self._default_field_mapping()[col_lower], 1.0
+        if col_lower in self._synonyms:
+            return self._synonyms[col_lower], 1.0
         
         best_match = None
         best_score = 0.0
@@ -369,6 +409,33 @@ class GenericCSVMapper(BaseConnector):
         
         return best_match, best_score
     
+    def _calculate_similarity(self, field_a: str, field_b: str) -> float:
+        """Score how likely two field names refer to the same field (0.0 - 1.0)"""
+        a = field_a.lower().replace(' ', '_').replace('-', '_')
+        b = field_b.lower().replace(' ', '_').replace('-', '_')
+        
+        # Cheap exits before any character-level comparison
+        if a == b:
+            return 1.0
+        if not a or not b:
+            return 0.0
+        
+        # Known synonyms (e.g. cost -> price) map to the same Structr field
+        field_mapping = self._synonyms
+        if a in field_mapping and field_mapping[a] == field_mapping.get(b):
+            return 1.0
+        
+        # Token overlap is usually conclusive for snake_case headers
+        tokens_a = set(t for t in a.split('_') if t)
+        tokens_b = set(t for t in b.split('_') if t)
+        union = tokens_a | tokens_b
+        token_score = len(tokens_a & tokens_b) / len(union) if union else 0.0
+        if token_score >= 0.8:
+            return token_score
+        
+        # Fall back to full character-level comparison
+        return max(token_score, _string_ratio(a, b))
+    
     def _validate_id_field(self, series: pd.Series) -> float:
         """Validate if series looks like product IDs"""
         non_null = series.dropna()
@@ -522,7 +589,7 @@ class GenericCSVMapper(BaseConnector):
             recommendations.append("Review and customize field mappings - many columns couldn't be auto-mapped")
         
         # File size recommendations
-        file_size = analysis['file_info']['size_mb']
+        file_size = analysis.get('file_info', {}).get('size_mb', 0)
         if file_size > 100:
             recommendations.append("Large file detected - consider batch processing for better performance")
         
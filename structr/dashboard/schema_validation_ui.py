@@ -443,7 +443,9 @@ def show_field_validation_results(field_results: Dict[str, Any], title: str, des
         return
     
     for field_name, result in field_results.items():
-        field_config = result.get('field_config', {})
+        field_config = GoogleProductSchemaValidator.FIELD_CONFIGS.get(
+            result.get('field_key', field_name), {}
+        )
         
         # Field header
         col1, col2 = st.columns([3, 1])
@@ -40,7 +40,7 @@ def create_sample_data():
                 "material": "100% Organic Cotton",
                 "care_instructions": "Machine wash cold, tumble dry low",
                 "sustainability_info": "GOTS certified, carbon neutral shipping",
-                "gtin": "1234567890123",
+                "gtin": "1234567890128",
                 "mpn": "ECO-SHIRT-001",
                 "weight": "0.5",
                 "weight_unit": "LB",
@@ -110,7 +110,7 @@ def create_sample_data():
                 "certifications": "Fair Trade, USDA Organic",
                 "weight": "1",
                 "weight_unit": "LB",
-                "gtin": "3456789012345",
+                "gtin": "3456789012340",
                 "mpn": "MPC-COL-001",
                 "rating": 4.9,
                 "review_count": 203
@@ -183,7 +183,7 @@ print(json.dumps(schema, indent=2))
     
     # Test fix functionality on specific product
     if Path("output/bundles").exists():
-        bundles = list(Path("output/bundles").iterdir())
+        bundles = [p for p in Path("output/bundles").iterdir() if p.is_dir()]
         if bundles:
             test_product = bundles[0].name
             print(f"\n🔧 Fix Feature Test (targeting {test_product}):")
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 class ProductData(BaseModel):
     """Core product data structure"""
+    model_config = ConfigDict(frozen=True)
+
     handle: str
     title: str
     description: Optional[str] = None
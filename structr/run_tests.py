@@ -10,7 +10,7 @@ import subprocess
 from pathlib import Path
 
 
-def run_tests():
+def run_tests(fast=False):
     """Run all tests with pytest"""
     
     # Ensure we're in the right directory
@@ -26,6 +26,10 @@ def run_tests():
         "--color=yes"
     ]
     
+    # Skip tests marked slow (redundant/expensive checks)
+    if fast:
+        cmd.extend(["-m", "not slow"])
+    
     # Add coverage if pytest-cov is available
     try:
         import pytest_cov
@@ -82,6 +86,8 @@ def main():
     parser.add_argument("--file", "-f", help="Run specific test file")
     parser.add_argument("--install-deps", action="store_true", 
                        help="Install test dependencies")
+    parser.add_argument("--fast", action="store_true",
+                       help="Skip tests marked slow")
     
     args = parser.parse_args()
     
@@ -100,7 +106,7 @@ def main():
         return run_specific_test(args.file)
     else:
         print("Running all tests...")
-        return run_tests()
+        return run_tests(fast=args.fast)
 
 
 if __name__ == "__main__":
@@ -9,11 +9,26 @@ https://developers.google.com/search/docs/appearance/structured-data/product
 """
 
 import json
+import re
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from models.pdp import ProductData
 
 
+# Accepted schema.org availability URLs for Offer objects
+_VALID_AVAILABILITY = frozenset([
+    'https://schema.org/InStock',
+    'https://schema.org/OutOfStock',
+    'https://schema.org/OnlineOnly',
+    'https://schema.org/InStoreOnly',
+    'https://schema.org/LimitedAvailability',
+    'https://schema.org/PreOrder'
+])
+
+# Plain decimal prices always parse with float(); anything else takes the slow path
+_PRICE_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
 class GoogleProductSchemaGenerator:
     """Generates Google-compliant Product schema markup"""
     
@@ -278,6 +293,17 @@ class GoogleProductSchemaGenerator:
                 errors.append("Offer must be an object")
                 continue
             
+            availability = offer.get('availability')
+            # Only strings can be valid; lists/dicts are unhashable for the set
+            availability_ok = isinstance(availability, str) and availability in _VALID_AVAILABILITY
+            
+            # Fast path: well-formed offers need no per-field checks
+            if (offer.get('@type') == 'Offer'
+                    and availability_ok
+                    and 'priceCurrency' in offer
+                    and _PRICE_RE.fullmatch(str(offer.get('price', '')))):
+                continue
+            
             # Required offer fields
             required_offer_fields = ['@type', 'price', 'priceCurrency', 'availability']
             
@@ -298,16 +324,8 @@ class GoogleProductSchemaGenerator:
             
             # Validate availability URL
             if 'availability' in offer:
-                valid_availability = [
-                    'https://schema.org/InStock',
-                    'https://schema.org/OutOfStock', 
-                    'https://schema.org/OnlineOnly',
-                    'https://schema.org/InStoreOnly',
-                    'https://schema.org/LimitedAvailability',
-                    'https://schema.org/PreOrder'
-                ]
-                if offer['availability'] not in valid_availability:
-                    errors.append(f"Invalid availability value: {offer['availability']}")
+                if not availability_ok:
+                    errors.append(f"Invalid availability value: {availability}")
         
         return errors
     
@@ -11,6 +11,16 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line(
+        "markers", "slow: redundant or expensive checks (deselect with -m 'not slow')"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run grouped tests on the same pytest-xdist worker"
+    )
+
+
 @pytest.fixture
 def sample_product_data():
     """Fixture providing sample ProductData for testing"""
@@ -29,7 +39,7 @@ def sample_product_data():
             "material": "Cotton",
             "color": "Blue",
             "size": "Medium",
-            "gtin": "1234567890123"
+            "gtin": "1234567890128"
         }
     )
 
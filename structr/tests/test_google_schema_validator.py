@@ -0,0 +1,311 @@
+"""
+Unit tests for GoogleProductSchemaValidator
+
+Tests GTIN check digits, URL checks, fast-mode validation and the
+per-bundle result cache used by validate_all_bundles.
+"""
+
+import json
+import os
+
+import pytest
+
+from config import CONFIG
+from validators import schema_validator
+from validators.schema_validator import GoogleProductSchemaValidator, validate_all_bundles
+
+
+PRODUCT_SCHEMA = {
+    "@context": "https://schema.org",
+    "@type": "Product",
+    "name": "Test Product",
+    "image": "https://example.com/test.jpg",
+    "description": "A high-quality test product",
+    "sku": "TEST-001",
+    "offers": {
+        "@type": "Offer",
+        "price": "29.99",
+        "priceCurrency": "USD",
+        "availability": "https://schema.org/InStock"
+    }
+}
+
+
+def _touch(path):
+    """Push a file's mtime forward so the change is visible at any resolution"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def bundles_dir(tmp_path, monkeypatch):
+    """Bundles dir with one bundle per schema source, wired into CONFIG"""
+    (tmp_path / "from-schema").mkdir()
+    (tmp_path / "from-schema" / "schema.json").write_text(json.dumps(PRODUCT_SCHEMA))
+    
+    (tmp_path / "from-sync").mkdir()
+    (tmp_path / "from-sync" / CONFIG.SYNC_FILENAME).write_text(
+        json.dumps({"output": {"schema": PRODUCT_SCHEMA}})
+    )
+    
+    (tmp_path / "from-html").mkdir()
+    (tmp_path / "from-html" / CONFIG.HTML_FILENAME).write_text(
+        '<script type="application/ld+json">%s</script>' % json.dumps(PRODUCT_SCHEMA)
+    )
+    
+    monkeypatch.setattr(CONFIG, "get_bundles_dir", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def validated(monkeypatch):
+    """Record the bundle paths that actually get validated"""
+    calls = []
+    validate_one = schema_validator._validate_one
+    
+    def recording_validate_one(path_str):
+        calls.append(os.path.basename(path_str))
+        return validate_one(path_str)
+    
+    monkeypatch.setattr(schema_validator, "_validate_one", recording_validate_one)
+    return calls
+
+
+def _write_bundle(bundles_dir, bundle_id, schema):
+    """Write a bundle whose schema lives in schema.json"""
+    bundle_path = bundles_dir / bundle_id
+    bundle_path.mkdir()
+    (bundle_path / "schema.json").write_text(json.dumps(schema))
+    return bundle_path
+
+
+VALID_GTINS = [
+    "96385074",        # GTIN-8
+    "036000291452",    # GTIN-12 (UPC-A)
+    "4006381333931",   # GTIN-13 (EAN-13)
+    "10012345678902",  # GTIN-14
+]
+
+
+class TestGtinValidation:
+    """Test suite for GTIN format and check-digit validation"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.validator = GoogleProductSchemaValidator()
+    
+    @pytest.mark.parametrize("gtin", VALID_GTINS)
+    def test_valid_check_digit(self, gtin):
+        """Known-good GTINs of every length pass"""
+        result = self.validator._validate_recommended_gtin(gtin)
+        
+        assert result == {"valid": True, "issues": []}
+    
+    @pytest.mark.parametrize("gtin", VALID_GTINS)
+    def test_check_digit_off_by_one(self, gtin):
+        """Changing only the check digit is flagged"""
+        wrong = gtin[:-1] + str((int(gtin[-1]) + 1) % 10)
+        
+        result = self.validator._validate_recommended_gtin(wrong)
+        
+        assert result["valid"] is False
+        assert result["issues"] == ["GTIN check digit is invalid"]
+    
+    @pytest.mark.parametrize("gtin", ["1234567", "12345678901", "400638133393100", "400638133393\u0669", "abcdefgh"])
+    def test_bad_format(self, gtin):
+        """Wrong lengths and non-ASCII or non-digit characters fail the format check"""
+        result = self.validator._validate_recommended_gtin(gtin)
+        
+        assert result["valid"] is False
+        assert result["issues"] == ["GTIN must be 8, 12, 13, or 14 digits"]
+
+
+class TestUrlValidation:
+    """Test suite for the cached image URL check"""
+    
+    @pytest.mark.parametrize("url,expected", [
+        ("https://cdn.example.com/a.jpg", True),
+        ("http://example.com", True),
+        ("ftp://files.example.com/a.jpg", True),
+        ("https:///a.jpg", False),
+        ("http://?q=1", False),
+        ("not-a-url", False),
+        # urlparse strips control characters and validates brackets
+        ("https://[::1", False),
+        ("https://\t/x", False),
+        ("http://\n/a", False),
+        # Non-ASCII netlocs whose NFKC form hides a delimiter make urlparse raise
+        ("https://a\u2100b/x.jpg", False),
+        ("https://ex\uff0fample.com/x.jpg", False),
+        ("http://\uff03a", False),
+    ])
+    def test_matches_urlparse(self, url, expected):
+        """The fast path agrees with urlparse on every case"""
+        from urllib.parse import urlparse
+        
+        try:
+            parsed = urlparse(url)
+            reference = bool(parsed.scheme and parsed.netloc)
+        except ValueError:
+            reference = False
+        
+        assert reference is expected
+        assert schema_validator._is_valid_url(url) is expected
+
+
+class TestFastMode:
+    """Test suite for validate_bundle_schema(fast_mode=True)"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.validator = GoogleProductSchemaValidator()
+    
+    def test_missing_sku_returns_early(self, tmp_path):
+        """A missing required field short-circuits with the reduced result"""
+        schema = {k: v for k, v in PRODUCT_SCHEMA.items() if k != "sku"}
+        bundle_path = _write_bundle(tmp_path, "no-sku", schema)
+        
+        result = self.validator.validate_bundle_schema(bundle_path, fast_mode=True)
+        
+        assert result == {
+            "bundle_id": "no-sku",
+            "schema_found": True,
+            "schema_type": "Product",
+            "google_eligible": False,
+            "missing_required": ["sku"]
+        }
+    
+    def test_missing_offer_price_returns_early(self, tmp_path):
+        """Missing offers fields are reported with an offers. prefix"""
+        offers = {k: v for k, v in PRODUCT_SCHEMA["offers"].items() if k != "price"}
+        bundle_path = _write_bundle(tmp_path, "no-price", {**PRODUCT_SCHEMA, "offers": offers})
+        
+        result = self.validator.validate_bundle_schema(bundle_path, fast_mode=True)
+        
+        assert result["google_eligible"] is False
+        assert result["missing_required"] == ["offers.price"]
+        assert "summary" not in result
+        assert "compliance_score" not in result
+    
+    def test_alt_path_counts_as_present(self, tmp_path, monkeypatch):
+        """Fast mode and a full run agree on fields found via alt_paths"""
+        sku_config = {
+            **GoogleProductSchemaValidator.REQUIRED_FIELDS["sku"],
+            "_all_paths": (("sku",), ("productID",)),
+        }
+        monkeypatch.setitem(GoogleProductSchemaValidator.REQUIRED_FIELDS, "sku", sku_config)
+        schema = {k: v for k, v in PRODUCT_SCHEMA.items() if k != "sku"}
+        bundle_path = _write_bundle(tmp_path, "alt-sku", {**schema, "productID": "TEST-001"})
+        
+        fast = self.validator.validate_bundle_schema(bundle_path, fast_mode=True)
+        full = self.validator.validate_bundle_schema(bundle_path)
+        
+        assert "missing_required" not in fast
+        assert fast["google_eligible"] is full["google_eligible"] is True
+    
+    def test_complete_schema_gets_full_report(self, tmp_path):
+        """With every required field present, fast mode matches a full run"""
+        bundle_path = _write_bundle(tmp_path, "complete", PRODUCT_SCHEMA)
+        
+        fast = self.validator.validate_bundle_schema(bundle_path, fast_mode=True)
+        full = self.validator.validate_bundle_schema(bundle_path)
+        
+        assert fast == full
+        assert "missing_required" not in fast
+        assert fast["google_eligible"] is True
+        assert fast["summary"]["required_passed"] == fast["summary"]["required_total"]
+
+
+class TestValidationCache:
+    """Test suite for the validate_all_bundles result cache"""
+    
+    def test_cache_hit_returns_stored_result(self, bundles_dir, validated):
+        """Unchanged bundles are served from the cache file"""
+        first = validate_all_bundles()
+        assert sorted(validated) == ["from-html", "from-schema", "from-sync"]
+        assert (bundles_dir / schema_validator._CACHE_FILENAME).exists()
+        
+        validated.clear()
+        second = validate_all_bundles()
+        
+        assert validated == []
+        assert second == first
+        assert all(result["google_eligible"] for result in second)
+    
+    @pytest.mark.parametrize("bundle_id,filename", [
+        ("from-schema", "schema.json"),
+        ("from-sync", CONFIG.SYNC_FILENAME),
+        ("from-html", CONFIG.HTML_FILENAME),
+    ])
+    def test_touching_source_file_invalidates_bundle(self, bundles_dir, validated,
+                                                     bundle_id, filename):
+        """Changing any schema source revalidates only that bundle"""
+        validate_all_bundles()
+        validated.clear()
+        
+        _touch(bundles_dir / bundle_id / filename)
+        validate_all_bundles()
+        
+        assert validated == [bundle_id]
+    
+    def test_clear_cache_revalidates_everything(self, bundles_dir, validated):
+        """clear_cache=True ignores the stored results"""
+        validate_all_bundles()
+        validated.clear()
+        
+        validate_all_bundles(clear_cache=True)
+        
+        assert sorted(validated) == ["from-html", "from-schema", "from-sync"]
+    
+    @pytest.mark.parametrize("cache_text", [
+        "{not json",
+        json.dumps({"version": -1, "bundles": {}}),
+        json.dumps(["not", "a", "dict"]),
+    ])
+    def test_corrupt_or_stale_cache_is_ignored(self, bundles_dir, validated, cache_text):
+        """Unreadable caches and other cache versions are rebuilt"""
+        validate_all_bundles()
+        cache_file = bundles_dir / schema_validator._CACHE_FILENAME
+        cache_file.write_text(cache_text)
+        validated.clear()
+        
+        results = validate_all_bundles()
+        
+        assert sorted(validated) == ["from-html", "from-schema", "from-sync"]
+        assert all(result["google_eligible"] for result in results)
+        assert json.loads(cache_file.read_text())["version"] == schema_validator._CACHE_VERSION
+    
+    def test_concurrent_saves_leave_a_whole_cache(self, bundles_dir):
+        """Parallel callers each write their own temp file before replacing"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            runs = list(executor.map(lambda _: validate_all_bundles(clear_cache=True), range(16)))
+        
+        assert all(len(results) == 3 for results in runs)
+        cache = json.loads((bundles_dir / schema_validator._CACHE_FILENAME).read_text())
+        assert sorted(cache["bundles"]) == ["from-html", "from-schema", "from-sync"]
+        assert not list(bundles_dir.glob("*.tmp"))
+    
+    def test_validation_errors_are_not_cached(self, bundles_dir, validated, monkeypatch):
+        """Unexpected exceptions are retried on the next run"""
+        def broken_validate(bundle_path, fast_mode=False):
+            raise RuntimeError("disk hiccup")
+        
+        monkeypatch.setattr(
+            schema_validator._shared_validator, "validate_bundle_schema", broken_validate
+        )
+        results = validate_all_bundles()
+        
+        assert all(result["error"].startswith("Validation error") for result in results)
+        cache = json.loads((bundles_dir / schema_validator._CACHE_FILENAME).read_text())
+        assert cache["bundles"] == {}
+        
+        # Drop the instance override so the class method is used again
+        monkeypatch.delattr(schema_validator._shared_validator, "validate_bundle_schema")
+        validated.clear()
+        
+        results = validate_all_bundles()
+        
+        assert sorted(validated) == ["from-html", "from-schema", "from-sync"]
+        assert all(result["google_eligible"] for result in results)
@@ -6,12 +6,21 @@ Tests schema generation, validation, and compliance with Google Rich Results req
 
 import pytest
 import json
-from datetime import datetime
+from pathlib import Path
 
 from models.pdp import ProductData
 from schemas.schema_generator import GoogleProductSchemaGenerator, generate_product_schema, validate_product_schema
 
 
+# Tests are independent; keep them on one worker under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group(name="schema_generator")
+
+# Rich product data with all fields, parsed once at import
+RICH_PRODUCT_DATA = json.loads(
+    (Path(__file__).parent / "fixtures" / "rich_product.json").read_bytes()
+)
+
+
 class TestGoogleProductSchemaGenerator:
     """Test suite for GoogleProductSchemaGenerator"""
     
@@ -29,34 +38,7 @@ class TestGoogleProductSchemaGenerator:
         )
         
         # Rich product data with all fields
-        self.rich_product = ProductData(
-            handle="premium-shirt",
-            title="Premium Cotton Shirt",
-            description="Premium 100% organic cotton shirt with superior comfort and style",
-            price=89.99,
-            brand="Premium Brand",
-            category="Clothing > Shirts",
-            images=[
-                "https://example.com/shirt-front.jpg",
-                "https://example.com/shirt-back.jpg"
-            ],
-            features=[
-                "100% organic cotton",
-                "Machine washable",
-                "Available in multiple colors"
-            ],
-            metafields={
-                "gtin": "1234567890123",
-                "mpn": "PS-001",
-                "material": "Organic Cotton",
-                "color": "Blue",
-                "size": "Large",
-                "weight": "0.5",
-                "weight_unit": "LB",
-                "rating": 4.5,
-                "review_count": 25
-            }
-        )
+        self.rich_product = ProductData(**RICH_PRODUCT_DATA)
     
     def test_generate_basic_schema(self):
         """Test generating schema with minimal product data"""
@@ -98,7 +80,7 @@ class TestGoogleProductSchemaGenerator:
         # Check additional identifiers
         assert schema["sku"] == "premium-shirt"
         assert schema["model"] == "premium-shirt"
-        assert schema["gtin"] == "1234567890123"
+        assert schema["gtin"] == "1234567890128"
         assert schema["mpn"] == "PS-001"
         
         # Check additional properties
@@ -149,10 +131,12 @@ class TestGoogleProductSchemaGenerator:
         
         errors = self.generator.validate_schema(invalid_schema)
         
-        assert len(errors) > 0
-        assert any("Missing required field: description" in error for error in errors)
-        assert any("Missing required field: image" in error for error in errors)
-        assert any("Missing required field: offers" in error for error in errors)
+        expected = {
+            "Missing required field: description",
+            "Missing required field: image",
+            "Missing required field: offers"
+        }
+        assert expected <= set(errors)
     
     def test_schema_validation_invalid_offers(self):
         """Test validation catches invalid offers structure"""
@@ -172,10 +156,12 @@ class TestGoogleProductSchemaGenerator:
         
         errors = self.generator.validate_schema(schema_invalid_offers)
         
-        assert len(errors) > 0
-        assert any("Offer @type must be 'Offer'" in error for error in errors)
-        assert any("Invalid price format" in error for error in errors)
-        assert any("Missing required offer field: availability" in error for error in errors)
+        expected = {
+            "Offer @type must be 'Offer'",
+            "Invalid price format: invalid_price",
+            "Missing required offer field: availability"
+        }
+        assert expected <= set(errors)
     
     def test_schema_validation_invalid_images(self):
         """Test validation catches invalid image formats"""
@@ -210,6 +196,11 @@ class TestGoogleProductSchemaGenerator:
         errors = self.generator._validate_offers(invalid_offers)
         assert any("Invalid availability value" in error for error in errors)
         
+        # Malformed (list/dict) availability is reported, not raised
+        for malformed in (["https://schema.org/InStock"], {"@id": "https://schema.org/InStock"}):
+            errors = self.generator._validate_offers({**invalid_offers, "availability": malformed})
+            assert f"Invalid availability value: {malformed}" in errors
+        
         # Test valid availability options
         valid_availabilities = [
             "https://schema.org/InStock",
@@ -276,14 +267,16 @@ class TestGoogleProductSchemaGenerator:
         parsed_schema = json.loads(json_content)
         assert parsed_schema["@type"] == "Product"
     
-    def test_convenience_functions(self):
-        """Test convenience functions work correctly"""
-        # Test generate_product_schema function
+    def test_convenience_generate(self):
+        """Test generate_product_schema convenience function"""
         schema = generate_product_schema(self.basic_product)
         assert schema["@type"] == "Product"
         assert schema["name"] == "Test Product"
-        
-        # Test validate_product_schema function
+    
+    @pytest.mark.slow
+    def test_convenience_validate(self):
+        """Test validate_product_schema convenience function"""
+        schema = generate_product_schema(self.basic_product)
         errors = validate_product_schema(schema)
         assert len(errors) == 0
         
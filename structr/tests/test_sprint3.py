@@ -8,72 +8,105 @@ This test suite covers the new Sprint 3 functionality including:
 - Batch processing with job queue
 - Progress monitoring
 - API endpoints
+
+Run with: pytest tests/test_sprint3.py
 """
 
 import pytest
-import tempfile
-import json
-import pandas as pd
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import asyncio
-import time
-
-# Import Sprint 3 modules
-from connectors.shopify.importer import ShopifyCSVImporter
-from connectors.generic.csv_mapper import GenericCSVMapper
-from connectors.pim.connector import PIMConnector
-from batch.queues.job_queue import JobQueue
-from batch.processors.batch_manager import BatchManager
-from batch.processors.parallel_processor import ParallelProcessor
-from batch.monitors.progress_monitor import ProgressMonitor
+import csv
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+import threading
+
+# Sprint 3 modules are imported where they are used so that collecting or
+# running a single test class does not pull in every connector and processor
+
+
+# Sample CSV data shared by the connector tests
+SHOPIFY_CSV_DATA = {
+    'Handle': ['test-product-1', 'test-product-2'],
+    'Title': ['Test Product 1', 'Test Product 2'], 
+    'Body (HTML)': ['<p>Product 1 description</p>', '<p>Product 2 description</p>'],
+    'Vendor': ['Test Brand', 'Test Brand'],
+    'Type': ['Apparel', 'Apparel'],
+    'Tags': ['tag1, tag2', 'tag3, tag4'],
+    'Variant Price': [29.99, 39.99],
+    'Variant SKU': ['SKU001', 'SKU002'],
+    'Image Src': ['https://example.com/img1.jpg', 'https://example.com/img2.jpg']
+}
+
+# Various CSV formats to test intelligent mapping
+ECOMMERCE_CSV_DATA = {
+    'product_name': ['Widget A', 'Widget B'],
+    'product_description': ['Great widget', 'Better widget'],
+    'cost': [19.99, 24.99],
+    'manufacturer': ['WidgetCorp', 'WidgetCorp'],
+    'product_id': ['W001', 'W002']
+}
+
+CATALOG_CSV_DATA = {
+    'item_title': ['Gadget 1', 'Gadget 2'],
+    'item_desc': ['Useful gadget', 'Very useful gadget'],
+    'retail_price': [15.00, 20.00],
+    'brand_name': ['GadgetCo', 'GadgetCo'],
+    'sku_code': ['G001', 'G002']
+}
+
+
+def _write_csv(path, cols):
+    """Write a dict of column -> values to a CSV file"""
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(cols.keys())
+        w.writerows(zip(*cols.values()))
+
+
+@pytest.fixture(scope="session")
+def csv_paths(tmp_path_factory):
+    """Sample CSV files by name, written once per session in parallel"""
+    base = tmp_path_factory.mktemp("csvs")
+    jobs = {"shopify": SHOPIFY_CSV_DATA, "catalog": CATALOG_CSV_DATA}
+    
+    with ThreadPoolExecutor() as ex:
+        futures = [ex.submit(_write_csv, base / f"{name}.csv", data) for name, data in jobs.items()]
+        for future in futures:
+            future.result()  # Surface write errors
+    
+    return {name: base / f"{name}.csv" for name in jobs}
+
+
+@pytest.fixture(scope="class")
+def mapper():
+    """GenericCSVMapper shared by all tests in a class"""
+    from connectors.generic.csv_mapper import GenericCSVMapper
+    return GenericCSVMapper()
 
 
 class TestShopifyCSVImporter:
     """Test Shopify CSV import functionality"""
     
     def setup_method(self):
+        from connectors.shopify.importer import ShopifyCSVImporter
         self.importer = ShopifyCSVImporter()
-        
-        # Create sample Shopify CSV data
-        self.sample_csv_data = {
-            'Handle': ['test-product-1', 'test-product-2'],
-            'Title': ['Test Product 1', 'Test Product 2'], 
-            'Body (HTML)': ['<p>Product 1 description</p>', '<p>Product 2 description</p>'],
-            'Vendor': ['Test Brand', 'Test Brand'],
-            'Type': ['Apparel', 'Apparel'],
-            'Tags': ['tag1, tag2', 'tag3, tag4'],
-            'Variant Price': [29.99, 39.99],
-            'Variant SKU': ['SKU001', 'SKU002'],
-            'Image Src': ['https://example.com/img1.jpg', 'https://example.com/img2.jpg']
-        }
     
-    def test_detect_csv_structure(self):
+    def test_detect_csv_structure(self, csv_paths):
         """Test CSV structure detection"""
         
-        # Create temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            df = pd.DataFrame(self.sample_csv_data)
-            df.to_csv(f.name, index=False)
-            csv_path = Path(f.name)
-        
-        try:
-            analysis = self.importer.detect_csv_structure(csv_path)
-            
-            # Verify analysis results
-            assert analysis['row_count'] == 2
-            assert 'Handle' in analysis['columns']
-            assert 'Title' in analysis['columns']
-            assert 'suggested_mappings' in analysis
-            assert 'data_quality' in analysis
-            
-        finally:
-            csv_path.unlink()
+        analysis = self.importer.detect_csv_structure(csv_paths["shopify"])
+        
+        # Verify analysis results
+        assert analysis['row_count'] == 2
+        assert 'Handle' in analysis['columns']
+        assert 'Title' in analysis['columns']
+        assert 'suggested_mappings' in analysis
+        assert 'data_quality' in analysis
     
     def test_field_mapping_suggestions(self):
         """Test intelligent field mapping suggestions"""
         
-        result = self.importer._suggest_field_mappings(list(self.sample_csv_data.keys()))
+        result = self.importer._suggest_field_mappings(list(SHOPIFY_CSV_DATA.keys()))
         
         # Verify key mappings are suggested
         assert 'id' in result  # Handle -> id
@@ -82,110 +115,59 @@ class TestShopifyCSVImporter:
         assert 'vendor' in result  # Vendor -> vendor
         assert 'price' in result  # Variant Price -> price
     
-    def test_data_import(self):
+    def test_data_import(self, csv_paths):
         """Test data import from Shopify CSV"""
         
-        # Create temporary CSV
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            df = pd.DataFrame(self.sample_csv_data)
-            df.to_csv(f.name, index=False)
-            csv_path = Path(f.name)
+        result = self.importer.import_data(csv_paths["shopify"])
         
-        try:
-            # Test import
-            result = self.importer.import_data(csv_path)
-            
-            assert result.success
-            assert result.total_processed >= 1
-            assert len(result.errors) == 0 or result.total_processed > 0
-            
-        finally:
-            csv_path.unlink()
+        assert result.success
+        assert result.total_processed >= 1
+        assert len(result.errors) == 0 or result.total_processed > 0
 
 
 class TestGenericCSVMapper:
     """Test generic CSV mapping functionality"""
     
-    def setup_method(self):
-        self.mapper = GenericCSVMapper()
-        
-        # Create various CSV formats to test intelligent mapping
-        self.ecommerce_csv = {
-            'product_name': ['Widget A', 'Widget B'],
-            'product_description': ['Great widget', 'Better widget'],
-            'cost': [19.99, 24.99],
-            'manufacturer': ['WidgetCorp', 'WidgetCorp'],
-            'product_id': ['W001', 'W002']
-        }
-        
-        self.catalog_csv = {
-            'item_title': ['Gadget 1', 'Gadget 2'],
-            'item_desc': ['Useful gadget', 'Very useful gadget'],
-            'retail_price': [15.00, 20.00],
-            'brand_name': ['GadgetCo', 'GadgetCo'],
-            'sku_code': ['G001', 'G002']
-        }
-    
-    def test_csv_structure_analysis(self):
+    def test_csv_structure_analysis(self, mapper):
         """Test intelligent CSV structure analysis"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            df = pd.DataFrame(self.ecommerce_csv)
-            df.to_csv(f.name, index=False)
-            csv_path = Path(f.name)
-        
-        try:
-            analysis = self.mapper.analyze_csv_structure(csv_path)  # Pass Path object
-            
-            assert analysis['row_count'] == 2
-            assert 'suggested_mappings' in analysis
-            assert 'data_quality' in analysis
-            
-        finally:
-            csv_path.unlink()
-    
-    def test_field_similarity_scoring(self):
-        """Test field similarity algorithms"""
-        
-        # Test semantic similarity
-        score = self.mapper._calculate_similarity('title', 'product_name')
-        assert score > 0.5
+        # In-memory data skips the CSV write and re-parse
+        analysis = mapper.analyze_dataframe(ECOMMERCE_CSV_DATA)
         
-        score = self.mapper._calculate_similarity('description', 'product_description')
-        assert score > 0.5
-        
-        score = self.mapper._calculate_similarity('price', 'cost')
-        assert score > 0.3
+        assert analysis['row_count'] == 2
+        assert 'suggested_mappings' in analysis
+        assert 'data_quality' in analysis
+    
+    @pytest.mark.parametrize("a,b,threshold", [
+        ('title', 'product_name', 0.5),
+        ('description', 'product_description', 0.5),
+        ('price', 'cost', 0.3),
+    ])
+    def test_field_similarity_scoring(self, mapper, a, b, threshold):
+        """Test field similarity algorithms"""
+        assert mapper._calculate_similarity(a, b) > threshold
     
-    def test_transformation_preview(self):
+    def test_transformation_preview(self, mapper, csv_paths):
         """Test data transformation preview"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            df = pd.DataFrame(self.catalog_csv)
-            df.to_csv(f.name, index=False)
-            csv_path = Path(f.name)
-        
-        try:
-            mapping = {
-                'title': 'item_title',
-                'description': 'item_desc', 
-                'price': 'retail_price',
-                'brand': 'brand_name',
-                'handle': 'sku_code'
-            }
-            
-            # Test import instead of preview
-            result = self.mapper.import_data(csv_path)
-            assert result.success or len(result.errors) < len(self.catalog_csv)
-            
-        finally:
-            csv_path.unlink()
+        mapping = {
+            'title': 'item_title',
+            'description': 'item_desc', 
+            'price': 'retail_price',
+            'brand': 'brand_name',
+            'handle': 'sku_code'
+        }
+        
+        # Test import instead of preview
+        result = mapper.import_data(csv_paths["catalog"])
+        assert result.success or len(result.errors) < len(CATALOG_CSV_DATA)
 
 
 class TestJobQueue:
     """Test job queue functionality"""
     
     def setup_method(self):
+        from batch.queues.job_queue import JobQueue
         self.queue = JobQueue()
     
     def test_job_creation_and_retrieval(self):
@@ -226,14 +208,15 @@ class TestJobQueue:
         
         from batch.queues.job_queue import JobType
         
-        # Test multiple job submissions
+        # Test multiple in-process job submissions (no JSON persistence)
         job_ids = []
         for i in range(3):
-            job_id = self.queue.submit_job(JobType.GENERATE_PDP, {'data': f'test{i}'})
+            job_id = self.queue.submit_job(JobType.GENERATE, {'data': f'test{i}'}, serialize=False)
             job_ids.append(job_id)
         
         assert len(job_ids) == 3
         assert all(job_id is not None for job_id in job_ids)
+        assert not any((self.queue.storage_dir / f"{job_id}.json").exists() for job_id in job_ids)
     
     def test_queue_persistence(self):
         """Test job queue persistence"""
@@ -251,6 +234,7 @@ class TestProgressMonitor:
     """Test progress monitoring functionality"""
     
     def setup_method(self):
+        from batch.monitors.progress_monitor import ProgressMonitor
         self.monitor = ProgressMonitor()
     
     def test_operation_tracking(self):
@@ -303,29 +287,45 @@ class TestProgressMonitor:
         # Note: we just check that error was tracked
     
     def test_realtime_updates(self):
-        """Test real-time progress updates"""
+        """Test concurrent progress updates from worker threads"""
         
-        op_id = self.monitor.register_operation(
-            operation_id='realtime_test',
+        op_id = 'realtime_test'
+        self.monitor.register_operation(
+            operation_id=op_id,
             operation_type='test',
             total_items=100
         )
         
-        # Simulate progress updates
-        for i in range(0, 101, 20):
-            self.monitor.update_progress(op_id, completed_items=i)
-            progress = self.monitor.get_progress(op_id)
-            assert progress is not None
-            assert progress.completed_items == i
+        def worker():
+            for _ in range(25):
+                self.monitor.increment_progress(op_id)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # No increments may be lost under contention
+        progress = self.monitor.get_progress(op_id)
+        assert progress is not None
+        assert progress.processed_items == 100
 
 
 class TestBatchManager:
     """Test batch processing management"""
     
-    def setup_method(self):
-        self.queue = JobQueue()
-        self.monitor = ProgressMonitor() 
-        self.batch_manager = BatchManager(self.queue, self.monitor)
+    @pytest.fixture(autouse=True)
+    def batch_manager(self, tmp_path):
+        """BatchManager writing to tmp_path, with the global job queue mocked out"""
+        from batch.processors.batch_manager import BatchManager
+        
+        with patch('batch.processors.batch_manager.get_job_queue') as mock_get_queue:
+            self.queue = mock_get_queue.return_value
+            self.queue.get_job.return_value = None
+            self.output_dir = tmp_path
+            self.batch_manager = BatchManager(output_dir=tmp_path)
+            yield self.batch_manager
     
     @patch('batch.processors.batch_manager.BatchManager._execute_generation_job')
     def test_batch_generation_job_creation(self, mock_execute):
@@ -366,49 +366,83 @@ class TestBatchManager:
         status = self.batch_manager.get_job_status(job_id)
         assert status['type'] == 'batch_fix'
     
-    @patch('connectors.shopify.importer.ShopifyCSVImporter')
-    def test_import_and_generate_job(self, mock_importer):
+    def test_import_and_generate_job(self):
         """Test import and generate workflow"""
+        from unittest.mock import create_autospec
+        from connectors.base import BaseConnector, ImportResult
+        from models.pdp import ProductData
         
-        # Mock successful import
-        mock_importer.return_value.import_csv.return_value = Mock(
+        connector = create_autospec(BaseConnector, instance=True)
+        connector.import_data.return_value = ImportResult(
             success=True,
-            products=[{'handle': 'imported-1', 'title': 'Imported Product'}],
-            total_processed=1
+            total_records=1,
+            processed_records=1,
+            failed_records=0,
+            imported_products=[ProductData(handle='imported-1', title='Imported Product')]
         )
+        self.queue.submit_job.side_effect = ['import-job', 'generate-job']
+        
+        batch_id = self.batch_manager.import_and_generate(connector, 'test.csv')
         
-        job_id = self.batch_manager.create_import_and_generate_job(
-            'test.csv',
-            connector_type='shopify',
-            batch_size=10
+        # Generation waits on the import job
+        import_call, generate_call = self.queue.submit_job.call_args_list
+        assert generate_call.kwargs['dependencies'] == ['import-job']
+        assert self.batch_manager.get_batch_status(batch_id)['status'] == 'importing'
+        
+        # Run the queued import job the way a queue worker would
+        result = self.batch_manager._process_import_job(
+            SimpleNamespace(input_data=import_call.kwargs['input_data'])
         )
         
-        assert job_id is not None
+        assert result.success, result.error
+        connector.import_data.assert_called_once_with('test.csv')
+        products_file = self.output_dir / f"{batch_id}_imported_products.json"
+        assert result.data['products_file'] == str(products_file)
+        assert '"handle": "imported-1"' in products_file.read_text()
         
-        status = self.batch_manager.get_job_status(job_id)
-        assert status['type'] == 'import_and_generate'
+        status = self.batch_manager.get_batch_status(batch_id)
+        assert status['status'] == 'imported'
+        assert status['total_products'] == 1
 
 
 class TestParallelProcessor:
     """Test parallel processing functionality"""
     
     def setup_method(self):
+        from batch.processors.parallel_processor import ParallelProcessor
         self.processor = ParallelProcessor()
     
     def test_parallel_task_execution(self):
         """Test parallel task execution"""
         
+        from batch.processors.parallel_processor import ParallelProcessor, ProcessingConfig
+        
+        processor = ParallelProcessor(ProcessingConfig(max_workers=4, chunk_size=1))
+        
+        lock = threading.Lock()
+        running = 0
+        max_concurrent = 0
+        # Each task waits for a peer, so the batch only succeeds if two run at once
+        barrier = threading.Barrier(2, timeout=5)
+        
         def sample_task(item):
-            time.sleep(0.1)  # Simulate work
+            nonlocal running, max_concurrent
+            with lock:
+                running += 1
+                max_concurrent = max(max_concurrent, running)
+            barrier.wait()
+            with lock:
+                running -= 1
             return {'processed': item, 'success': True}
         
         items = ['item1', 'item2', 'item3', 'item4']
         
-        results = self.processor.process_batch(sample_task, items)
+        result = processor.process_batch_threading(items, sample_task)
         
-        assert len(results) == 4
-        for result in results:
-            assert result['success'] is True
+        assert len(result.results) == 4
+        for item_result in result.results:
+            assert item_result['success'] is True
+        assert max_concurrent >= 2
     
     def test_error_handling_in_parallel_processing(self):
         """Test error handling during parallel processing"""
@@ -432,25 +466,22 @@ class TestParallelProcessor:
     def test_progress_callback(self):
         """Test progress reporting during parallel processing"""
         
-        progress_updates = []
+        # Single-slot snapshot: the callback does one store, the test reads it at the end
+        completed_seen = array('I', [0])
         
-        def progress_callback(completed, total):
-            progress_updates.append((completed, total))
+        def progress_callback(completed, total, elapsed):
+            completed_seen[0] = completed
         
         def simple_task(item):
             return {'item': item}
         
         items = ['a', 'b', 'c']
         
-        self.processor.process_batch(
-            simple_task, 
-            items, 
-            progress_callback=progress_callback
-        )
+        self.processor.add_progress_callback(progress_callback)
+        self.processor.process_batch_threading(items, simple_task)
         
-        # Should have received progress updates
-        assert len(progress_updates) > 0
-        assert progress_updates[-1] == (3, 3)  # Final update should be complete
+        # Final update should be complete
+        assert completed_seen[0] == 3
 
 
 class TestAPIIntegration:
@@ -483,7 +514,7 @@ class TestAPIIntegration:
 
 # Integration test fixtures and utilities
 @pytest.fixture
-def sample_shopify_csv():
+def sample_shopify_csv(tmp_path):
     """Create a sample Shopify CSV file for testing"""
     data = {
         'Handle': ['test-product'],
@@ -493,11 +524,13 @@ def sample_shopify_csv():
         'Variant Price': [29.99]
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        pd.DataFrame(data).to_csv(f.name, index=False)
-        yield f.name
+    csv_path = tmp_path / "sample.csv"
+    with csv_path.open('w', newline='') as f:
+        w = csv.DictWriter(f, fieldnames=list(data.keys()))
+        w.writeheader()
+        w.writerow({k: v[0] for k, v in data.items()})
     
-    Path(f.name).unlink()
+    return str(csv_path)
 
 
 @pytest.fixture
@@ -522,4 +555,4 @@ def sample_products():
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__, '-v']))